@@ -0,0 +1,55 @@
+"""
+config.py
+Runtime settings for the transliteration service, read from environment variables.
+"""
+import os
+from dataclasses import dataclass, field
+
+
+def default_num_threads() -> int:
+    """
+    Split the CPU cores between uvicorn workers. uvicorn takes its default worker count
+    from WEB_CONCURRENCY, so WEB_CONCURRENCY=2 uvicorn app.main:app gives each worker half.
+    """
+    workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+@dataclass
+class Settings:
+    """
+    All knobs for model loading, CPU threading and micro-batching.
+    """
+    # Local folder or Hugging Face Hub id of the fine-tuned checkpoint (pushed by Byteforgers.ipynb).
+    model_path: str = "torr20/another-avro"
+    # torch intra-op threads per worker process (cores / WEB_CONCURRENCY unless set).
+    num_threads: int = field(default_factory=default_num_threads)
+    # Max tokens per input/output sequence (same as max_length in the notebook).
+    max_length: int = 64
+    num_beams: int = 4
+
+    # Micro-batching: how long to wait for more requests, and how big a batch may get.
+    batch_window_ms: float = 10.0
+    max_batch_size: int = 16
+    # Budget on padded input tokens per generate() call (batch size x longest input).
+    max_batch_tokens: int = 512
+
+    # Optional word table (see build_word_table.py). Empty = send everything to the model.
+    word_table_path: str = ""
+    # Max recent model outputs kept in the LRU cache when the word table is used.
+    cache_size: int = 10000
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        defaults = cls()
+        return cls(
+            model_path=os.getenv("TRANSLIT_MODEL_PATH", defaults.model_path),
+            num_threads=int(os.getenv("TRANSLIT_NUM_THREADS", defaults.num_threads)),
+            max_length=int(os.getenv("TRANSLIT_MAX_LENGTH", defaults.max_length)),
+            num_beams=int(os.getenv("TRANSLIT_NUM_BEAMS", defaults.num_beams)),
+            batch_window_ms=float(os.getenv("TRANSLIT_BATCH_WINDOW_MS", defaults.batch_window_ms)),
+            max_batch_size=int(os.getenv("TRANSLIT_MAX_BATCH_SIZE", defaults.max_batch_size)),
+            max_batch_tokens=int(os.getenv("TRANSLIT_MAX_BATCH_TOKENS", defaults.max_batch_tokens)),
+            word_table_path=os.getenv("TRANSLIT_WORD_TABLE", defaults.word_table_path),
+            cache_size=int(os.getenv("TRANSLIT_CACHE_SIZE", defaults.cache_size)),
+        )
@@ -0,0 +1,53 @@
+"""
+main.py
+FastAPI entry point for the Banglish -> Bengali transliteration service.
+Loads the fine-tuned mT5 model once per worker process and starts the micro-batcher.
+"""
+
+from fastapi import FastAPI
+from app.config import Settings
+from app.routes import transliterate
+from app.utils.batcher import MicroBatcher
+from app.utils.hybrid import HybridTransliterator
+from app.utils.translit_model import get_model
+from app.utils.word_table import WordTable
+
+app = FastAPI(
+    title="Banglish to Bengali Transliteration",
+    description="CPU inference API for the Challenge 1 mT5 transliteration model.",
+    version="1.0.0"
+)
+
+@app.on_event("startup")
+def load_model():
+    settings = Settings.from_env()
+    app.state.settings = settings
+    model = get_model()
+    if settings.word_table_path:
+        # Dictionary-first: table hits skip the model entirely.
+        model = HybridTransliterator(
+            model,
+            WordTable(settings.word_table_path),
+            cache_size=settings.cache_size,
+            max_batch_size=settings.max_batch_size,
+            max_batch_tokens=settings.max_batch_tokens
+        )
+        print(f"Startup: Using word table {settings.word_table_path} ({len(model.table)} words)")
+    app.state.batcher = MicroBatcher(
+        model,
+        window_ms=settings.batch_window_ms,
+        max_batch_size=settings.max_batch_size,
+        max_batch_tokens=settings.max_batch_tokens
+    )
+    app.state.batcher.start()
+    print(f"Startup: Loaded model from {settings.model_path} ({settings.num_threads} threads)")
+
+@app.on_event("shutdown")
+async def stop_batcher():
+    await app.state.batcher.stop()
+
+app.include_router(transliterate.router)
+
+@app.get("/")
+def root():
+    return {"message": "Banglish -> Bengali transliteration. POST /transliterate, see /docs."}
@@ -0,0 +1,40 @@
+"""
+transliterate.py
+Provides the FastAPI route that converts Banglish text to Bengali script.
+"""
+
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+
+from app.utils.constants import DECODING_MODES
+
+router = APIRouter(tags=["Transliteration"])
+
+class TransliterateRequest(BaseModel):
+    text: str
+    mode: str = "greedy"  # "greedy" or "beam"
+
+@router.post("/transliterate")
+async def transliterate(body: TransliterateRequest, request: Request):
+    """
+    Transliterate one Banglish sentence. Concurrent requests are micro-batched
+    into a single model call by the MicroBatcher started in main.py.
+    Texts longer than the model's max_length are rejected rather than truncated.
+    """
+    text = body.text.strip()
+    if not text:
+        raise HTTPException(status_code=400, detail="text must not be empty")
+    if body.mode not in DECODING_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {list(DECODING_MODES)}")
+
+    batcher = request.app.state.batcher
+    max_length = request.app.state.settings.max_length
+    num_tokens = batcher.model.count_tokens(text)
+    if num_tokens > max_length:
+        raise HTTPException(
+            status_code=413,
+            detail=f"text is {num_tokens} tokens long, the limit is {max_length}; send one sentence at a time"
+        )
+
+    result = await batcher.submit(text, body.mode, num_tokens=num_tokens)
+    return {"text": body.text, "transliteration": result, "mode": body.mode}
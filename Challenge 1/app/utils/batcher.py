@@ -0,0 +1,146 @@
+"""
+batcher.py
+Dynamic micro-batching: requests that arrive within a short window are merged
+into one generate() call instead of each paying for its own forward passes.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    # Type hint only: keeps torch/transformers out of the import, so stub models work in tests.
+    from app.utils.translit_model import TransliterationModel
+
+
+@dataclass
+class _Pending:
+    text: str
+    mode: str
+    num_tokens: int
+    future: asyncio.Future
+
+
+class MicroBatcher:
+    """
+    Collects queued requests for up to window_ms (or until max_batch_size /
+    max_batch_tokens is reached), then runs them through the model together.
+    Only one generate() runs at a time; requests arriving meanwhile form the next batch.
+    model can also be a HybridTransliterator, which has the same interface.
+    """
+
+    def __init__(
+        self,
+        model: "TransliterationModel",
+        window_ms: float,
+        max_batch_size: int,
+        max_batch_tokens: int
+    ):
+        self.model = model
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self._queue: Optional[asyncio.Queue] = None
+        self._carry: Optional[_Pending] = None
+        # Batch currently being collected or run; failed on stop() along with the queue.
+        self._batch: List[_Pending] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the batching loop and fail every request that hasn't been answered yet,
+        so no caller is left waiting on a future that will never resolve.
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        unfinished = list(self._batch)
+        if self._carry is not None:
+            unfinished.append(self._carry)
+            self._carry = None
+        while self._queue is not None and not self._queue.empty():
+            unfinished.append(self._queue.get_nowait())
+        self._batch = []
+        for p in unfinished:
+            if not p.future.done():
+                p.future.set_exception(RuntimeError("transliteration service is shutting down"))
+
+    async def submit(self, text: str, mode: str = "greedy", num_tokens: Optional[int] = None) -> str:
+        """
+        Queue one text and wait for its transliteration.
+        num_tokens can be passed when the caller already counted them.
+        """
+        loop = asyncio.get_running_loop()
+        pending = _Pending(
+            text=text,
+            mode=mode,
+            num_tokens=self.model.count_tokens(text) if num_tokens is None else num_tokens,
+            future=loop.create_future()
+        )
+        await self._queue.put(pending)
+        return await pending.future
+
+    def _fits(self, batch: List[_Pending], item: _Pending) -> bool:
+        # Cost of a batch is its padded size: every row is as long as the longest one.
+        longest = max([item.num_tokens] + [p.num_tokens for p in batch])
+        return len(batch) < self.max_batch_size and longest * (len(batch) + 1) <= self.max_batch_tokens
+
+    async def _collect(self) -> List[_Pending]:
+        """
+        Block for the first request, then gather more until the window closes or a limit is hit.
+        """
+        loop = asyncio.get_running_loop()
+        if self._carry is not None:
+            first, self._carry = self._carry, None
+        else:
+            first = await self._queue.get()
+        batch = self._batch = [first]
+        deadline = loop.time() + self.window
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if not self._fits(batch, item):
+                # Over budget: it starts the next batch instead.
+                self._carry = item
+                break
+            batch.append(item)
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+
+            # Greedy and beam requests need different generate() settings.
+            by_mode: Dict[str, List[_Pending]] = {}
+            for p in batch:
+                by_mode.setdefault(p.mode, []).append(p)
+
+            for mode, items in by_mode.items():
+                try:
+                    # Run in a thread so the event loop keeps accepting requests meanwhile.
+                    outputs = await loop.run_in_executor(
+                        None, self.model.generate, [p.text for p in items], mode
+                    )
+                except Exception as e:
+                    for p in items:
+                        if not p.future.done():
+                            p.future.set_exception(e)
+                    continue
+                for p, out in zip(items, outputs):
+                    if not p.future.done():
+                        p.future.set_result(out)
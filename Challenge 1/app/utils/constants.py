@@ -0,0 +1,10 @@
+"""
+constants.py
+Values shared by training and inference. Kept free of heavy imports so either side can use it.
+"""
+
+# Task prefix the model is fine-tuned and queried with.
+PREFIX = "translate Banglish to Bengali: "
+
+# Decoding modes accepted by TransliterationModel.generate() and the /transliterate route.
+DECODING_MODES = ("greedy", "beam")
@@ -0,0 +1,158 @@
+"""
+hybrid.py
+Dictionary-first transliteration: frequent words are answered from the WordTable,
+and only the out-of-vocabulary spans go to the mT5 model in batched calls
+(chunked by the same size/token limits MicroBatcher uses).
+Recent model outputs are kept in a bounded LRU cache.
+"""
+import re
+import threading
+from collections import OrderedDict
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
+
+from app.utils.word_table import EDGE_PUNCTUATION, WordTable, normalize_banglish
+
+_TOKEN = re.compile(r"\S+")
+
+
+class LRUCache:
+    """
+    Small thread-safe LRU map (the model runs in a worker thread).
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[str]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value: str):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _split_token(token: str) -> Tuple[str, str, str]:
+    """
+    Split "kemon?" into ("", "kemon", "?") so punctuation passes through untouched.
+    """
+    core = token.strip(EDGE_PUNCTUATION)
+    if not core:
+        return token, "", ""
+    start = token.index(core)
+    return token[:start], core, token[start + len(core):]
+
+
+class HybridTransliterator:
+    """
+    Same generate()/count_tokens() interface as TransliterationModel, so it can be
+    handed to MicroBatcher in place of the bare model.
+    """
+
+    def __init__(
+        self,
+        model,
+        table: WordTable,
+        cache_size: int = 10000,
+        max_batch_size: int = 16,
+        max_batch_tokens: int = 512
+    ):
+        self.model = model
+        self.table = table
+        self.cache = LRUCache(cache_size)
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        # "table_words" also counts punctuation-only tokens, which never need the model.
+        self.stats = {"words": 0, "table_words": 0, "cached_spans": 0, "model_spans": 0}
+
+    def count_tokens(self, text: str) -> int:
+        return self.model.count_tokens(text)
+
+    def _lookup(self, token: str) -> Optional[str]:
+        """
+        Table answer for one whitespace token (punctuation kept in place), or None if it is OOV.
+        Pure punctuation tokens pass through unchanged.
+        """
+        lead, core, trail = _split_token(token)
+        if not core:
+            return token
+        known = self.table.get(normalize_banglish(core))
+        return None if known is None else lead + known + trail
+
+    def _chunks(self, spans: List[str]) -> List[List[str]]:
+        """
+        Split spans into model batches that respect max_batch_size and the padded-token
+        budget (batch size x longest span), so one micro-batch can't become one huge generate().
+        """
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        longest = 0
+        for span in spans:
+            tokens = self.model.count_tokens(span)
+            if chunk and (
+                len(chunk) >= self.max_batch_size
+                or max(longest, tokens) * (len(chunk) + 1) > self.max_batch_tokens
+            ):
+                chunks.append(chunk)
+                chunk, longest = [], 0
+            chunk.append(span)
+            longest = max(longest, tokens)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def generate(self, texts: List[str], mode: str = "greedy") -> List[str]:
+        # Each sentence becomes a list of parts: either a finished string or a pending OOV span.
+        plans: List[List[Tuple[str, str]]] = []
+        pending: Dict[str, Optional[str]] = {}
+
+        for text in texts:
+            parts: List[Tuple[str, str]] = []
+            looked_up = [(token, self._lookup(token)) for token in _TOKEN.findall(text)]
+            self.stats["words"] += len(looked_up)
+            for is_oov, group in groupby(looked_up, key=lambda item: item[1] is None):
+                group = list(group)
+                if is_oov:
+                    # Consecutive unknown words go to the model together, keeping their context.
+                    span_text = " ".join(token for token, _ in group)
+                    parts.append(("span", span_text))
+                    pending.setdefault(span_text, None)
+                else:
+                    self.stats["table_words"] += len(group)
+                    parts.extend(("text", known) for _, known in group)
+            plans.append(parts)
+
+        # Resolve OOV spans: LRU first, then batched model calls for the rest.
+        misses = []
+        for span_text in pending:
+            cached = self.cache.get((mode, span_text))
+            if cached is None:
+                misses.append(span_text)
+            else:
+                pending[span_text] = cached
+                self.stats["cached_spans"] += 1
+        for chunk in self._chunks(misses):
+            outputs = self.model.generate(chunk, mode)
+            self.stats["model_spans"] += len(chunk)
+            for span_text, out in zip(chunk, outputs):
+                pending[span_text] = out
+                self.cache.put((mode, span_text), out)
+
+        return [
+            " ".join(pending[value] if kind == "span" else value for kind, value in parts)
+            for parts in plans
+        ]
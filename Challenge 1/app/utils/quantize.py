@@ -0,0 +1,129 @@
+"""
+quantize.py
+Dynamic int8 quantization of the transliteration model for CPU inference.
+
+A quantized checkpoint folder holds the usual config + tokenizer files and the state_dict
+of the quantized model (QUANTIZED_WEIGHTS), loaded with weights_only=True so a checkpoint
+folder can't run code. Int8 weights are stored as plain int8 tensors plus their scale and
+zero point rather than as quantized tensors (pickling those looks up torch.per_tensor_affine
+across every loaded module, which breaks on lazily imported packages).
+Loading builds the model skeleton on the meta device and swaps in empty int8 Linear layers
+before assigning the saved weights, so an fp32 copy of the model is never allocated.
+"""
+import os
+from collections import OrderedDict
+
+import torch
+from torch.ao.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+from torch.ao.quantization import quantize_dynamic
+from transformers import AutoConfig, AutoModelForSeq2SeqLM, AutoTokenizer, GenerationConfig
+
+QUANTIZED_WEIGHTS = "quantized_int8_weights.pt"
+# state_dict key suffixes of a dynamically quantized Linear's packed (weight, bias) and dtype.
+_PACKED = "_packed_params._packed_params"
+_PACKED_DTYPE = "_packed_params.dtype"
+
+
+def quantize_model(model):
+    """
+    Replace every nn.Linear with an int8 dynamically quantized version (weights int8,
+    activations quantized on the fly). Embeddings and layer norms stay fp32.
+    """
+    return quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _swap_in_empty_quantized_linears(module: torch.nn.Module):
+    """
+    Same module layout quantize_model produces, without reading any weights
+    (quantize_dynamic needs real values to pick scales, so it can't run on meta tensors).
+    """
+    for name, child in module.named_children():
+        if type(child) is torch.nn.Linear:
+            setattr(module, name, DynamicQuantizedLinear(
+                child.in_features,
+                child.out_features,
+                bias_=child.bias is not None,
+                dtype=torch.qint8
+            ))
+        else:
+            _swap_in_empty_quantized_linears(child)
+
+
+def _to_plain_tensors(state_dict: dict) -> dict:
+    """
+    Replace each packed (quantized weight, bias) pair with plain tensors.
+    """
+    plain = OrderedDict()
+    # Per-module format versions; quantized Linear needs them to read its entries back.
+    plain._metadata = getattr(state_dict, "_metadata", None)
+    for key, value in state_dict.items():
+        if key.endswith(_PACKED):
+            base = key[:-len(_PACKED)]
+            weight, bias = value
+            if weight.qscheme() != torch.per_tensor_affine:
+                raise ValueError(f"{key}: only per-tensor quantized weights are supported")
+            plain[base + "weight_int8"] = weight.int_repr()
+            plain[base + "weight_scale"] = torch.tensor(weight.q_scale(), dtype=torch.float64)
+            plain[base + "weight_zero_point"] = torch.tensor(weight.q_zero_point())
+            if bias is not None:
+                plain[base + "bias"] = bias
+        elif not key.endswith(_PACKED_DTYPE):
+            plain[key] = value
+    return plain
+
+
+def _from_plain_tensors(plain: dict) -> dict:
+    """
+    Inverse of _to_plain_tensors: rebuild the entries load_state_dict expects.
+    """
+    state_dict = OrderedDict(plain)
+    state_dict._metadata = getattr(plain, "_metadata", None)
+    for key in [k for k in plain if k.endswith("weight_int8")]:
+        base = key[:-len("weight_int8")]
+        weight = torch._make_per_tensor_quantized_tensor(
+            state_dict.pop(key),
+            state_dict.pop(base + "weight_scale").item(),
+            state_dict.pop(base + "weight_zero_point").item()
+        )
+        state_dict[base + _PACKED] = (weight, state_dict.pop(base + "bias", None))
+        state_dict[base + _PACKED_DTYPE] = torch.qint8
+    return state_dict
+
+
+def export_quantized(model_path: str, out_dir: str) -> str:
+    """
+    Quantize the fp32 checkpoint at model_path and save it to out_dir.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
+    model.eval()
+    quantized = quantize_model(model)
+
+    os.makedirs(out_dir, exist_ok=True)
+    model.config.save_pretrained(out_dir)
+    model.generation_config.save_pretrained(out_dir)
+    tokenizer.save_pretrained(out_dir)
+    torch.save(_to_plain_tensors(quantized.state_dict()), os.path.join(out_dir, QUANTIZED_WEIGHTS))
+    return out_dir
+
+
+def is_quantized_checkpoint(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, QUANTIZED_WEIGHTS))
+
+
+def load_quantized(path: str):
+    """
+    Load a folder written by export_quantized.
+    """
+    config = AutoConfig.from_pretrained(path)
+    with torch.device("meta"):
+        model = AutoModelForSeq2SeqLM.from_config(config)
+    _swap_in_empty_quantized_linears(model)
+
+    plain = torch.load(os.path.join(path, QUANTIZED_WEIGHTS), map_location="cpu", weights_only=True)
+    state_dict = _from_plain_tensors(plain)
+    # assign=True adopts the loaded tensors instead of copying into the meta placeholders.
+    model.load_state_dict(state_dict, assign=True)
+    model.generation_config = GenerationConfig.from_pretrained(path)
+    model.eval()
+    return model
@@ -0,0 +1,187 @@
+"""
+training.py
+Reusable training pipeline for the Banglish -> Bengali mT5 model (moved out of Byteforgers.ipynb).
+
+- The dataset is tokenized once and saved as an Arrow cache on disk; later runs
+  memory-map it with load_from_disk instead of re-tokenizing.
+- Examples are NOT padded at tokenization time. DataCollatorForSeq2Seq pads each batch
+  to its own longest example, and group_by_length puts similar lengths in the same batch,
+  so very little compute goes to pad tokens.
+"""
+import dataclasses
+import hashlib
+import os
+import shutil
+from typing import Optional, Tuple
+
+import evaluate
+import numpy as np
+import torch
+from datasets import Dataset, load_dataset, load_from_disk
+from transformers import (AutoTokenizer,
+                          DataCollatorForSeq2Seq,
+                          MT5ForConditionalGeneration,
+                          Seq2SeqTrainer,
+                          Seq2SeqTrainingArguments)
+
+from app.utils.constants import PREFIX
+
+DATASET_NAME = "SKNahin/bengali-transliteration-data"
+MAX_LENGTH = 64
+CACHE_DIR = "token_cache"
+# Local file extension -> datasets builder name.
+DATA_FILE_BUILDERS = {"csv": "csv", "json": "json", "jsonl": "json", "parquet": "parquet"}
+
+
+def load_splits(data_file: Optional[str] = None, test_size: float = 0.2, seed: int = 42) -> Tuple[Dataset, Dataset]:
+    """
+    Load the parallel data (columns "rm" = Banglish, "bn" = Bengali) and make the 80/20 split
+    used in the notebook. data_file can point to a local .csv/.json/.jsonl/.parquet instead of the Hub.
+    """
+    if data_file:
+        ext = os.path.splitext(data_file)[1].lstrip(".").lower()
+        if ext not in DATA_FILE_BUILDERS:
+            raise ValueError(
+                f"Unsupported data file format '.{ext}'; use one of: "
+                + ", ".join("." + e for e in DATA_FILE_BUILDERS)
+            )
+        builder = DATA_FILE_BUILDERS[ext]
+        raw_train_dataset = load_dataset(builder, data_files=data_file)["train"]
+    else:
+        raw_train_dataset = load_dataset(DATASET_NAME)["train"]
+
+    split_dataset = raw_train_dataset.train_test_split(test_size=test_size, seed=seed)
+    return split_dataset["train"], split_dataset["test"]
+
+
+def make_preprocess_function(tokenizer, max_length: int = MAX_LENGTH):
+    """
+    Tokenize with truncation only (no padding). Also stores a "length" column
+    so the length-grouped sampler does not have to recompute it.
+    """
+    def preprocess_function(examples):
+        model_inputs = tokenizer(
+            [PREFIX + text for text in examples["rm"]],
+            text_target=examples["bn"],
+            max_length=max_length,
+            truncation=True
+        )
+        model_inputs["length"] = [len(ids) for ids in model_inputs["input_ids"]]
+        return model_inputs
+
+    return preprocess_function
+
+
+def tokenize_cached(
+    dataset: Dataset,
+    tokenizer,
+    name: str,
+    model_name: str,
+    max_length: int = MAX_LENGTH,
+    cache_dir: str = CACHE_DIR
+) -> Dataset:
+    """
+    Return the tokenized dataset, building the on-disk Arrow cache on first use.
+    The returned dataset is always memory-mapped from disk rather than held in RAM.
+    The cache key includes the source dataset fingerprint and the task prefix, so different
+    data or a changed PREFIX never reuses a stale cache.
+    """
+    prefix_hash = hashlib.sha1(PREFIX.encode("utf-8")).hexdigest()[:8]
+    # datasets has no public accessor for the fingerprint it tracks through map/split.
+    key = f"{model_name.replace('/', '__')}-len{max_length}-prefix{prefix_hash}-{name}-{dataset._fingerprint}"
+    path = os.path.join(cache_dir, key)
+
+    if not os.path.isdir(path):
+        tokenized = dataset.map(
+            make_preprocess_function(tokenizer, max_length),
+            batched=True,
+            remove_columns=dataset.column_names
+        )
+        # Write next to the final path and rename, so an interrupted run never leaves a
+        # half-written cache that later runs would load.
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tokenized.save_to_disk(tmp_path)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another process finished the same cache first; keep theirs.
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+        print(f"Tokenized {len(tokenized)} examples into {path}")
+
+    return load_from_disk(path)
+
+
+def make_compute_metrics(tokenizer):
+    bleu = evaluate.load("bleu")
+
+    def compute_metrics(eval_preds):
+        preds, labels = eval_preds
+        # Ignored label positions are -100; turn them back into pad ids before decoding.
+        preds = np.where(preds != -100, preds, tokenizer.pad_token_id)
+        labels = np.where(labels != -100, labels, tokenizer.pad_token_id)
+        decoded_preds = tokenizer.batch_decode(preds, skip_special_tokens=True, clean_up_tokenization_spaces=True)
+        decoded_labels = tokenizer.batch_decode(labels, skip_special_tokens=True, clean_up_tokenization_spaces=True)
+
+        references = [[label] for label in decoded_labels]
+        results = bleu.compute(predictions=decoded_preds, references=references)
+        return {"bleu": results["bleu"]}
+
+    return compute_metrics
+
+
+def build_trainer(
+    model_name: str = "google/mt5-small",
+    output_dir: str = "banglish2bangla-mbart",
+    data_file: Optional[str] = None,
+    cache_dir: str = CACHE_DIR,
+    max_length: int = MAX_LENGTH,
+    **training_kwargs
+) -> Seq2SeqTrainer:
+    """
+    Build a ready-to-train Seq2SeqTrainer with cached tokenization, dynamic padding
+    and length-grouped batches. Extra keyword args go to Seq2SeqTrainingArguments.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = MT5ForConditionalGeneration.from_pretrained(model_name)
+
+    train_dataset, val_dataset = load_splits(data_file)
+    train_dataset = tokenize_cached(train_dataset, tokenizer, "train", model_name, max_length, cache_dir)
+    val_dataset = tokenize_cached(val_dataset, tokenizer, "validation", model_name, max_length, cache_dir)
+
+    data_collator = DataCollatorForSeq2Seq(tokenizer, model=model, pad_to_multiple_of=8)
+
+    args = dict(
+        output_dir=output_dir,
+        eval_strategy="epoch",
+        learning_rate=5e-5,
+        per_device_train_batch_size=4,
+        per_device_eval_batch_size=4,
+        num_train_epochs=3,
+        weight_decay=0.01,
+        save_total_limit=2,
+        logging_steps=100,
+        report_to="none",
+        length_column_name="length",
+        predict_with_generate=True,
+        generation_max_length=max_length,
+        fp16=torch.cuda.is_available()
+    )
+    # transformers 5 replaced the group_by_length flag with train_sampling_strategy.
+    if "train_sampling_strategy" in {f.name for f in dataclasses.fields(Seq2SeqTrainingArguments)}:
+        args["train_sampling_strategy"] = "group_by_length"
+    else:
+        args["group_by_length"] = True
+    args.update(training_kwargs)
+
+    return Seq2SeqTrainer(
+        model=model,
+        args=Seq2SeqTrainingArguments(**args),
+        train_dataset=train_dataset,
+        eval_dataset=val_dataset,
+        processing_class=tokenizer,
+        data_collator=data_collator,
+        compute_metrics=make_compute_metrics(tokenizer)
+    )
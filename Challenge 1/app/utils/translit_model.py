@@ -0,0 +1,71 @@
+"""
+translit_model.py
+Loads the fine-tuned mT5 Banglish -> Bengali model once per process and runs batched generation on CPU.
+"""
+from functools import lru_cache
+from typing import List
+
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+from app.config import Settings
+from app.utils.constants import DECODING_MODES, PREFIX
+from app.utils.quantize import is_quantized_checkpoint, load_quantized
+
+
+class TransliterationModel:
+    """
+    Wraps tokenizer + model. One instance per worker process (see get_model).
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        torch.set_num_threads(settings.num_threads)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(settings.model_path)
+        if is_quantized_checkpoint(settings.model_path):
+            # int8 folder written by evaluate_model.py --export-int8
+            self.model = load_quantized(settings.model_path)
+        else:
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(settings.model_path)
+        self.model.eval()
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Number of input tokens text takes up (including prefix). Not truncated, so callers
+        can reject inputs longer than max_length instead of silently cutting them off.
+        """
+        return len(self.tokenizer(PREFIX + text)["input_ids"])
+
+    def generate(self, texts: List[str], mode: str = "greedy") -> List[str]:
+        """
+        Transliterate a batch of Banglish strings with a single generate() call.
+        mode is "greedy" (fast) or "beam" (settings.num_beams beams).
+        """
+        if mode not in DECODING_MODES:
+            raise ValueError(f"Unknown decoding mode: {mode}")
+
+        inputs = self.tokenizer(
+            [PREFIX + text for text in texts],
+            max_length=self.settings.max_length,
+            truncation=True,
+            padding=True,
+            return_tensors="pt"
+        )
+        num_beams = self.settings.num_beams if mode == "beam" else 1
+        with torch.inference_mode():
+            output_ids = self.model.generate(
+                **inputs,
+                max_new_tokens=self.settings.max_length,
+                num_beams=num_beams,
+                do_sample=False
+            )
+        return self.tokenizer.batch_decode(output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True)
+
+
+@lru_cache(maxsize=1)
+def get_model() -> TransliterationModel:
+    """
+    Load the model on first use; every later call in the same process reuses it.
+    """
+    return TransliterationModel(Settings.from_env())
@@ -0,0 +1,142 @@
+"""
+word_table.py
+Compact, memory-mapped Banglish -> Bengali word lookup table.
+
+The table is a static open-addressing hash table stored in a single file:
+
+    header   : magic (8 bytes), n_slots (u32), n_entries (u32)
+    slots    : n_slots x u32 offset into the entry blob (EMPTY if unused)
+    entries  : per entry u16 key_len, u16 value_len, key bytes, value bytes (UTF-8)
+
+Lookups hash the key with crc32 and probe linearly, reading straight from the mmap,
+so opening the table is instant and the OS shares its pages across worker processes.
+"""
+import mmap
+import os
+import re
+import string
+import struct
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+
+MAGIC = b"BNWTBL01"
+HEADER = struct.Struct("<8sII")
+SLOT = struct.Struct("<I")
+ENTRY = struct.Struct("<HH")
+EMPTY = 0xFFFFFFFF
+
+# Punctuation stripped from word edges before lookup / when building (includes the Bengali danda).
+EDGE_PUNCTUATION = string.punctuation + "।॥‘’“”"
+
+_LATIN_WORD = re.compile(r"^[a-z0-9']+$")
+
+
+def normalize_banglish(word: str) -> str:
+    """
+    Lookup key for a Banglish word: lowercase, edge punctuation removed.
+    """
+    return word.strip(EDGE_PUNCTUATION).lower()
+
+
+def build_word_mapping(
+    pairs: Iterable[Tuple[str, str]],
+    min_count: int = 2,
+    min_share: float = 0.6
+) -> Dict[str, str]:
+    """
+    Learn word-level mappings from parallel sentences. Only sentence pairs with the same
+    number of words are used, aligned position by position. A Banglish word is kept if its
+    most common Bengali spelling was seen at least min_count times and accounts for at
+    least min_share of its occurrences, so ambiguous words are left to the model.
+    """
+    counts: Dict[str, Counter] = defaultdict(Counter)
+    for rm, bn in pairs:
+        rm_words = rm.split()
+        bn_words = bn.split()
+        if not rm_words or len(rm_words) != len(bn_words):
+            continue
+        for rm_word, bn_word in zip(rm_words, bn_words):
+            key = normalize_banglish(rm_word)
+            value = bn_word.strip(EDGE_PUNCTUATION)
+            if key and value and _LATIN_WORD.match(key):
+                counts[key][value] += 1
+
+    mapping = {}
+    for key, options in counts.items():
+        value, count = options.most_common(1)[0]
+        if count >= min_count and count / sum(options.values()) >= min_share:
+            mapping[key] = value
+    return mapping
+
+
+def _slot_for(key: bytes, n_slots: int) -> int:
+    return zlib.crc32(key) % n_slots
+
+
+def write_word_table(mapping: Dict[str, str], path: str, load_factor: float = 0.5):
+    """
+    Serialize mapping into the on-disk hash table format described above.
+    """
+    n_slots = max(8, int(len(mapping) / load_factor) + 1)
+    slots = [EMPTY] * n_slots
+    blob = bytearray()
+
+    for key, value in mapping.items():
+        key_bytes = key.encode("utf-8")
+        value_bytes = value.encode("utf-8")
+        slot = _slot_for(key_bytes, n_slots)
+        while slots[slot] != EMPTY:
+            slot = (slot + 1) % n_slots
+        slots[slot] = len(blob)
+        blob += ENTRY.pack(len(key_bytes), len(value_bytes)) + key_bytes + value_bytes
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, n_slots, len(mapping)))
+        f.write(struct.pack(f"<{n_slots}I", *slots))
+        f.write(blob)
+
+
+class WordTable:
+    """
+    Read-only view over a table file written by write_word_table.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.n_slots, self.n_entries = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a word table file")
+        self._slots_start = HEADER.size
+        self._blob_start = self._slots_start + self.n_slots * SLOT.size
+
+    def __len__(self) -> int:
+        return self.n_entries
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
+
+    def get(self, word: str) -> Optional[str]:
+        """
+        Bengali spelling for a normalized Banglish word, or None if it is not in the table.
+        """
+        key = word.encode("utf-8")
+        slot = _slot_for(key, self.n_slots)
+        for _ in range(self.n_slots):
+            (offset,) = SLOT.unpack_from(self._mm, self._slots_start + slot * SLOT.size)
+            if offset == EMPTY:
+                return None
+            pos = self._blob_start + offset
+            key_len, value_len = ENTRY.unpack_from(self._mm, pos)
+            pos += ENTRY.size
+            if self._mm[pos:pos + key_len] == key:
+                return self._mm[pos + key_len:pos + key_len + value_len].decode("utf-8")
+            slot = (slot + 1) % self.n_slots
+        return None
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
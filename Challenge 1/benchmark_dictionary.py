@@ -0,0 +1,83 @@
+"""
+benchmark_dictionary.py
+Compares model-only decoding with dictionary-first decoding (word table + LRU + model
+for OOV spans) on validation sentences.
+
+Reports word coverage of the table, latency per sentence, BLEU against the references,
+and BLEU of the hybrid output measured against the model-only output.
+
+Usage:
+    python build_word_table.py --out word_table.bin
+    python benchmark_dictionary.py --table word_table.bin --samples 500
+"""
+import argparse
+import time
+
+import evaluate
+
+from app.config import Settings
+from app.utils.hybrid import HybridTransliterator
+from app.utils.training import load_splits
+from app.utils.translit_model import TransliterationModel
+from app.utils.word_table import WordTable
+
+
+def run(translator, sentences: list, batch_size: int, mode: str) -> dict:
+    outputs = []
+    start = time.perf_counter()
+    for i in range(0, len(sentences), batch_size):
+        outputs.extend(translator.generate(sentences[i:i + batch_size], mode))
+    elapsed = time.perf_counter() - start
+    return {"outputs": outputs, "ms_per_sentence": 1000 * elapsed / len(sentences)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dictionary-first vs model-only transliteration.")
+    parser.add_argument("--model", default=Settings.model_path, help="Local folder or Hub id")
+    parser.add_argument("--table", default="word_table.bin")
+    parser.add_argument("--data-file", default=None, help="Local parallel file with rm/bn columns (default: Hub dataset)")
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--mode", default="greedy", choices=["greedy", "beam"])
+    parser.add_argument("--cache-size", type=int, default=Settings.cache_size)
+    args = parser.parse_args()
+
+    settings = Settings.from_env()
+    settings.model_path = args.model
+    model = TransliterationModel(settings)
+    table = WordTable(args.table)
+    hybrid = HybridTransliterator(
+        model,
+        table,
+        cache_size=args.cache_size,
+        max_batch_size=settings.max_batch_size,
+        max_batch_tokens=settings.max_batch_tokens
+    )
+
+    _, val_dataset = load_splits(args.data_file)
+    val_dataset = val_dataset.select(range(min(args.samples, len(val_dataset))))
+    sources = val_dataset["rm"]
+    references = [[bn] for bn in val_dataset["bn"]]
+    print(f"{len(sources)} sentences, table of {len(table)} words, mode {args.mode}\n")
+
+    bleu = evaluate.load("bleu")
+    # Untimed warm-up so first-generate() overhead doesn't land on whichever run goes first.
+    model.generate(sources[:args.batch_size], args.mode)
+    model_only = run(model, sources, args.batch_size, args.mode)
+    cold = run(hybrid, sources, args.batch_size, args.mode)
+    coverage = hybrid.stats["table_words"] / max(1, hybrid.stats["words"])
+    # Same sentences again: OOV spans now come from the LRU cache.
+    warm = run(hybrid, sources, args.batch_size, args.mode)
+
+    print(f"{'decoding':<22}{'ms/sentence':>13}{'BLEU':>8}{'BLEU vs model':>15}")
+    for name, r in (("model only", model_only), ("hybrid (cold cache)", cold), ("hybrid (warm cache)", warm)):
+        score = bleu.compute(predictions=r["outputs"], references=references)["bleu"]
+        agreement = bleu.compute(predictions=r["outputs"], references=[[o] for o in model_only["outputs"]])["bleu"]
+        print(f"{name:<22}{r['ms_per_sentence']:>13.1f}{score:>8.3f}{agreement:>15.3f}")
+
+    print(f"\nTable coverage: {coverage:.1%} of words")
+    print(f"Model spans decoded: {hybrid.stats['model_spans']}, served from LRU: {hybrid.stats['cached_spans']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+benchmark_training.py
+CPU benchmark: the notebook's fixed max_length padding vs. cached tokenization +
+dynamic padding + length-grouped batches (app/utils/training.py).
+
+Reports tokenization time, epoch time, real (non-pad) tokens/sec and the share of
+computed positions that were padding.
+
+Usage:
+    python benchmark_training.py --samples 512
+    python benchmark_training.py --model tiny-mt5 --data-file local_pairs.csv   # fully offline
+"""
+import argparse
+import time
+
+import torch
+from torch.utils.data import DataLoader, RandomSampler
+from transformers import (AutoTokenizer,
+                          DataCollatorForSeq2Seq,
+                          MT5ForConditionalGeneration,
+                          default_data_collator)
+from transformers.trainer_pt_utils import LengthGroupedSampler
+
+from app.utils.constants import PREFIX
+from app.utils.training import MAX_LENGTH, load_splits, tokenize_cached
+
+
+def tokenize_padded(dataset, tokenizer, max_length: int = MAX_LENGTH):
+    """
+    The notebook's preprocess_function: everything padded to max_length, labels included.
+    """
+    def preprocess_function(examples):
+        model_inputs = tokenizer(
+            [PREFIX + text for text in examples["rm"]],
+            max_length=max_length,
+            truncation=True,
+            padding="max_length"
+        )
+        labels = tokenizer(
+            text_target=examples["bn"],
+            max_length=max_length,
+            truncation=True,
+            padding="max_length"
+        )
+        model_inputs["labels"] = labels["input_ids"]
+        return model_inputs
+
+    return dataset.map(preprocess_function, batched=True, remove_columns=dataset.column_names)
+
+
+def train_step(model, optimizer, batch):
+    loss = model(**batch).loss
+    loss.backward()
+    optimizer.step()
+    optimizer.zero_grad()
+
+
+def train_one_epoch(model, loader, pad_token_id: int, warmup_steps: int = 3) -> dict:
+    """
+    Plain forward/backward/step loop over one epoch, counting real and padded tokens.
+    A few untimed warm-up steps run first, so thread-pool / allocator start-up and
+    first-call kernel overhead don't land on whichever pipeline happens to run first.
+    """
+    optimizer = torch.optim.AdamW(model.parameters(), lr=5e-5)
+    model.train()
+    for step, batch in enumerate(loader):
+        if step >= warmup_steps:
+            break
+        train_step(model, optimizer, batch)
+
+    real_tokens = 0
+    computed_tokens = 0
+
+    start = time.perf_counter()
+    for batch in loader:
+        labels = batch["labels"]
+        real_tokens += int(batch["attention_mask"].sum())
+        real_tokens += int(((labels != -100) & (labels != pad_token_id)).sum())
+        computed_tokens += batch["input_ids"].numel() + labels.numel()
+        train_step(model, optimizer, batch)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "epoch_s": elapsed,
+        "tokens_per_s": real_tokens / elapsed,
+        "pad_share": 1 - real_tokens / computed_tokens,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark padded vs. dynamic-padding training on CPU.")
+    parser.add_argument("--model", default="google/mt5-small")
+    parser.add_argument("--data-file", default=None, help="Local parallel file with rm/bn columns (default: Hub dataset)")
+    parser.add_argument("--samples", type=int, default=512, help="Training examples per epoch")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=None, help="torch.set_num_threads value")
+    parser.add_argument("--cache-dir", default="token_cache")
+    parser.add_argument("--warmup-steps", type=int, default=3, help="Untimed steps before each timed epoch")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    torch.manual_seed(0)
+
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    train_dataset, _ = load_splits(args.data_file)
+    train_dataset = train_dataset.select(range(min(args.samples, len(train_dataset))))
+    print(f"{len(train_dataset)} examples, batch size {args.batch_size}, {torch.get_num_threads()} threads\n")
+
+    # Before: re-tokenize every run, pad everything to max_length, random batches.
+    start = time.perf_counter()
+    padded = tokenize_padded(train_dataset, tokenizer)
+    padded_tok_s = time.perf_counter() - start
+    padded.set_format("torch")
+    padded_loader = DataLoader(
+        padded,
+        batch_size=args.batch_size,
+        sampler=RandomSampler(padded),
+        collate_fn=default_data_collator
+    )
+    model = MT5ForConditionalGeneration.from_pretrained(args.model)
+    before = train_one_epoch(model, padded_loader, tokenizer.pad_token_id, args.warmup_steps)
+    before["tokenize_s"] = padded_tok_s
+
+    # After: Arrow cache (timed on a warm cache), dynamic padding, length-grouped batches.
+    tokenize_cached(train_dataset, tokenizer, "bench", args.model, cache_dir=args.cache_dir)
+    start = time.perf_counter()
+    cached = tokenize_cached(train_dataset, tokenizer, "bench", args.model, cache_dir=args.cache_dir)
+    cached_tok_s = time.perf_counter() - start
+    lengths = cached["length"]
+    cached = cached.remove_columns("length")
+    model = MT5ForConditionalGeneration.from_pretrained(args.model)
+    dynamic_loader = DataLoader(
+        cached,
+        batch_size=args.batch_size,
+        sampler=LengthGroupedSampler(args.batch_size, lengths=lengths),
+        # Same collator settings as build_trainer.
+        collate_fn=DataCollatorForSeq2Seq(tokenizer, model=model, pad_to_multiple_of=8)
+    )
+    after = train_one_epoch(model, dynamic_loader, tokenizer.pad_token_id, args.warmup_steps)
+    after["tokenize_s"] = cached_tok_s
+
+    print(f"{'pipeline':<26}{'tokenize s':>12}{'epoch s':>10}{'tokens/s':>12}{'pad share':>11}")
+    for name, r in (("before (max_length pad)", before), ("after (dynamic + cache)", after)):
+        print(
+            f"{name:<26}{r['tokenize_s']:>12.2f}{r['epoch_s']:>10.2f}"
+            f"{r['tokens_per_s']:>12.0f}{r['pad_share']:>11.0%}"
+        )
+    print(f"\nEpoch speed-up: {before['epoch_s'] / after['epoch_s']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
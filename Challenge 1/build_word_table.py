@@ -0,0 +1,39 @@
+"""
+build_word_table.py
+Builds the memory-mapped Banglish -> Bengali word table used for dictionary-first
+transliteration (app/utils/word_table.py).
+
+Only the training part of the 80/20 split is used, so the validation sentences used by
+benchmark_dictionary.py stay unseen.
+
+Usage:
+    python build_word_table.py --out word_table.bin
+    python build_word_table.py --data-file local_pairs.csv --min-count 3
+    TRANSLIT_WORD_TABLE=word_table.bin uvicorn app.main:app
+"""
+import argparse
+import os
+
+from app.utils.training import load_splits
+from app.utils.word_table import build_word_mapping, write_word_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the word-level transliteration lookup table.")
+    parser.add_argument("--data-file", default=None, help="Local parallel file with rm/bn columns (default: Hub dataset)")
+    parser.add_argument("--out", default="word_table.bin")
+    parser.add_argument("--min-count", type=int, default=2, help="Min times the chosen spelling must be seen")
+    parser.add_argument("--min-share", type=float, default=0.6, help="Min share of the chosen spelling among all seen")
+    args = parser.parse_args()
+
+    train_dataset, _ = load_splits(args.data_file)
+    pairs = zip(train_dataset["rm"], train_dataset["bn"])
+    mapping = build_word_mapping(pairs, min_count=args.min_count, min_share=args.min_share)
+    write_word_table(mapping, args.out)
+
+    size_kb = os.path.getsize(args.out) / 1024
+    print(f"Wrote {len(mapping)} words from {len(train_dataset)} sentence pairs to {args.out} ({size_kb:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+evaluate_model.py
+Standalone latency/quality evaluation of the transliteration model on CPU.
+
+The validation split is streamed in batches through generate(); BLEU is accumulated
+batch by batch (bleu.add_batch) instead of decoding every prediction at once.
+Reports BLEU, throughput, per-request latency percentiles (measured in a separate
+pass with one sentence per generate() call, like a lone /transliterate request),
+resident memory after loading the model (steady state) and peak memory (high-water mark).
+
+It can also export a dynamically quantized int8 copy of the model and compare it with fp32.
+Each variant is evaluated in its own process so peak memory numbers don't mix.
+
+Usage:
+    python evaluate_model.py --model torr20/another-avro --samples 1000
+    python evaluate_model.py --model torr20/another-avro --export-int8 another-avro-int8 --compare
+    python evaluate_model.py --model another-avro-int8 --latency-samples 0  # skip the latency pass
+"""
+import argparse
+import gc
+import multiprocessing
+import os
+import resource
+import time
+
+import evaluate
+import numpy as np
+
+from app.config import Settings
+from app.utils.quantize import export_quantized
+from app.utils.training import load_splits
+from app.utils.translit_model import TransliterationModel
+
+
+def current_rss_mb() -> float:
+    # Second field of /proc/self/statm is resident pages (Linux).
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def evaluate_model(
+    model_path: str,
+    data_file: str,
+    samples: int,
+    batch_size: int,
+    latency_samples: int,
+    mode: str,
+    threads: int
+) -> dict:
+    """
+    Stream the validation split through the model and collect quality + cost metrics.
+    BLEU and throughput come from the batched pass; request latency from a batch-size-1 pass.
+    """
+    settings = Settings.from_env()
+    settings.model_path = model_path
+    if threads:
+        settings.num_threads = threads
+
+    load_start = time.perf_counter()
+    model = TransliterationModel(settings)
+    load_s = time.perf_counter() - load_start
+    gc.collect()
+    rss_after_load = current_rss_mb()
+
+    _, val_dataset = load_splits(data_file)
+    if samples:
+        val_dataset = val_dataset.select(range(min(samples, len(val_dataset))))
+
+    bleu = evaluate.load("bleu")
+    sentences = 0
+    start = time.perf_counter()
+    for batch in val_dataset.iter(batch_size=batch_size):
+        predictions = model.generate(batch["rm"], mode)
+        sentences += len(predictions)
+        bleu.add_batch(predictions=predictions, references=[[bn] for bn in batch["bn"]])
+    total_s = time.perf_counter() - start
+
+    # Batch timings only say how long a whole batch took; time single sentences for request latency.
+    latencies = []
+    for text in val_dataset.select(range(min(latency_samples, len(val_dataset))))["rm"]:
+        request_start = time.perf_counter()
+        model.generate([text], mode)
+        latencies.append(time.perf_counter() - request_start)
+    latencies_ms = np.array(latencies or [float("nan")]) * 1000
+
+    return {
+        "model": model_path,
+        "sentences": sentences,
+        "bleu": bleu.compute()["bleu"],
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p90_ms": float(np.percentile(latencies_ms, 90)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "sentences_per_s": sentences / total_s,
+        "load_s": load_s,
+        "rss_after_load_mb": rss_after_load,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def evaluate_in_subprocess(**kwargs) -> dict:
+    """
+    Run evaluate_model in a fresh process so its peak RSS is its own.
+    """
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(evaluate_model, kwds=kwargs)
+
+
+def print_results(results: list, batch_size: int):
+    print("p50/p90/p99: latency of a single-sentence request; "
+          f"sent/s: throughput at batch size {batch_size}\n")
+    print(
+        f"{'model':<32}{'BLEU':>7}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+        f"{'sent/s':>9}{'load s':>8}{'load MB':>9}{'peak MB':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['model'][-32:]:<32}{r['bleu']:>7.3f}{r['p50_ms']:>9.1f}{r['p90_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+            f"{r['sentences_per_s']:>9.1f}{r['load_s']:>8.1f}{r['rss_after_load_mb']:>9.0f}{r['peak_rss_mb']:>9.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate transliteration quality, latency and memory on CPU.")
+    parser.add_argument("--model", default=Settings.model_path, help="Local folder or Hub id (fp32 or int8 folder)")
+    parser.add_argument("--data-file", default=None, help="Local parallel file with rm/bn columns (default: Hub dataset)")
+    parser.add_argument("--samples", type=int, default=1000, help="Validation sentences to use (0 = all)")
+    parser.add_argument("--batch-size", type=int, default=16, help="Batch size for the BLEU/throughput pass")
+    parser.add_argument("--latency-samples", type=int, default=100,
+                        help="Sentences timed one at a time for request latency (0 = skip)")
+    parser.add_argument("--mode", default="greedy", choices=["greedy", "beam"])
+    parser.add_argument("--threads", type=int, default=None, help="torch.set_num_threads value")
+    parser.add_argument("--export-int8", metavar="OUT_DIR", default=None, help="Save a dynamically quantized int8 copy")
+    parser.add_argument("--compare", action="store_true", help="Evaluate fp32 and the exported int8 model side by side")
+    args = parser.parse_args()
+
+    if args.compare and not args.export_int8:
+        parser.error("--compare needs --export-int8 OUT_DIR")
+
+    if args.export_int8:
+        export_quantized(args.model, args.export_int8)
+        print(f"Saved int8 model to {args.export_int8}")
+
+    eval_kwargs = dict(
+        data_file=args.data_file,
+        samples=args.samples,
+        batch_size=args.batch_size,
+        latency_samples=args.latency_samples,
+        mode=args.mode,
+        threads=args.threads
+    )
+    model_paths = [args.model, args.export_int8] if args.compare else [args.model]
+    results = [evaluate_in_subprocess(model_path=path, **eval_kwargs) for path in model_paths]
+    print_results(results, args.batch_size)
+
+    if args.compare:
+        fp32, int8 = results
+        print(
+            f"\nint8 vs fp32: {fp32['p50_ms'] / int8['p50_ms']:.2f}x faster (request p50), "
+            f"{int8['sentences_per_s'] / fp32['sentences_per_s']:.2f}x throughput, "
+            f"BLEU {int8['bleu'] - fp32['bleu']:+.3f}, "
+            f"memory after load {int8['rss_after_load_mb'] - fp32['rss_after_load_mb']:+.0f} MB, "
+            f"peak memory {int8['peak_rss_mb'] - fp32['peak_rss_mb']:+.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+make_tiny_checkpoint.py
+Builds a tiny, randomly initialized mT5 checkpoint (with its own small SentencePiece
+tokenizer) entirely offline. Its outputs are garbage, but it has the same interface as
+the real model, so the service and scripts can be exercised without network access.
+
+Usage:
+    python make_tiny_checkpoint.py --out tiny-mt5
+    TRANSLIT_MODEL_PATH=tiny-mt5 uvicorn app.main:app
+"""
+import argparse
+import os
+import tempfile
+
+import sentencepiece as spm
+import torch
+from transformers import MT5Config, MT5ForConditionalGeneration, T5Tokenizer
+
+from app.utils.constants import PREFIX
+
+SAMPLE_PAIRS = [
+    ("ami tomake bhalobashi", "আমি তোমাকে ভালোবাসি"),
+    ("tumi kemon acho", "তুমি কেমন আছো"),
+    ("ami bhalo achi", "আমি ভালো আছি"),
+    ("aj khub gorom", "আজ খুব গরম"),
+    ("amar nam rahim", "আমার নাম রহিম"),
+    ("tumi kothay jaccho", "তুমি কোথায় যাচ্ছো"),
+    ("bhat kheyecho", "ভাত খেয়েছো"),
+    ("kal dekha hobe", "কাল দেখা হবে"),
+]
+
+
+def train_tokenizer(out_dir: str, vocab_size: int) -> T5Tokenizer:
+    """
+    Train a small SentencePiece model on the sample pairs, using the T5 special-token layout
+    (pad=0, eos=1, unk=2).
+    """
+    sentences = [PREFIX + rm for rm, _ in SAMPLE_PAIRS] + [bn for _, bn in SAMPLE_PAIRS]
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = os.path.join(tmp, "spiece")
+        spm.SentencePieceTrainer.train(
+            sentence_iterator=iter(sentences),
+            model_prefix=prefix,
+            vocab_size=vocab_size,
+            hard_vocab_limit=False,
+            character_coverage=1.0,
+            model_type="unigram",
+            pad_id=0,
+            eos_id=1,
+            unk_id=2,
+            bos_id=-1
+        )
+        # from_pretrained on the folder (not T5Tokenizer(vocab_file=...)): newer transformers
+        # versions ignore vocab_file and would build a tokenizer with only the special tokens.
+        tokenizer = T5Tokenizer.from_pretrained(tmp, extra_ids=0)
+        tokenizer.save_pretrained(out_dir)
+    return tokenizer
+
+
+def build_tiny_checkpoint(out_dir: str, vocab_size: int = 120, seed: int = 0) -> MT5ForConditionalGeneration:
+    """
+    Write a tokenizer and a randomly initialized tiny mT5 model to out_dir.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = train_tokenizer(out_dir, vocab_size)
+
+    torch.manual_seed(seed)
+    config = MT5Config(
+        vocab_size=len(tokenizer),
+        d_model=32,
+        d_kv=8,
+        d_ff=64,
+        num_layers=2,
+        num_decoder_layers=2,
+        num_heads=2,
+        pad_token_id=tokenizer.pad_token_id,
+        eos_token_id=tokenizer.eos_token_id,
+        decoder_start_token_id=tokenizer.pad_token_id
+    )
+    model = MT5ForConditionalGeneration(config)
+    model.save_pretrained(out_dir)
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a tiny random mT5 checkpoint for offline testing.")
+    parser.add_argument("--out", default="tiny-mt5", help="Output folder")
+    parser.add_argument("--vocab-size", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    model = build_tiny_checkpoint(args.out, args.vocab_size, args.seed)
+    print(f"Saved tiny checkpoint to {args.out} (vocab {model.config.vocab_size}, {model.num_parameters()} params)")
+
+
+if __name__ == "__main__":
+    main()
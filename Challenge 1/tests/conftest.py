@@ -0,0 +1,35 @@
+"""
+conftest.py
+Shared stub for the model interface (count_tokens/generate), so batching, hybrid and
+route tests run without torch.
+"""
+import pytest
+
+
+class StubModel:
+    """
+    One token per word; records every generate() call as (mode, texts).
+    output(text, mode) produces each transliteration.
+    """
+
+    def __init__(self, output):
+        self.output = output
+        self.calls = []
+
+    def count_tokens(self, text):
+        return len(text.split())
+
+    def generate(self, texts, mode="greedy"):
+        self.calls.append((mode, list(texts)))
+        return [self.output(text, mode) for text in texts]
+
+
+@pytest.fixture
+def make_stub_model():
+    """
+    Factory for StubModel; the default output is "<mode>:<text>".
+    """
+    def make(output=lambda text, mode: f"{mode}:{text}"):
+        return StubModel(output)
+
+    return make
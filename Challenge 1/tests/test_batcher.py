@@ -0,0 +1,83 @@
+"""
+test_batcher.py
+MicroBatcher behaviour with the stub model from conftest.py (no torch needed).
+"""
+import asyncio
+import threading
+
+from app.utils.batcher import MicroBatcher
+
+
+def run_batch(model, requests, **limits):
+    """
+    Start a batcher, submit all requests concurrently and return their results.
+    """
+    settings = dict(window_ms=50, max_batch_size=16, max_batch_tokens=1000)
+    settings.update(limits)
+
+    async def main():
+        batcher = MicroBatcher(model, **settings)
+        batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit(text, mode) for text, mode in requests))
+        finally:
+            await batcher.stop()
+
+    return asyncio.run(main())
+
+
+def test_concurrent_requests_share_one_generate_call(make_stub_model):
+    model = make_stub_model()
+    texts = ["ami", "tumi", "se", "amra", "tomra"]
+    results = run_batch(model, [(t, "greedy") for t in texts])
+
+    assert model.calls == [("greedy", texts)]
+    assert results == [f"greedy:{t}" for t in texts]
+
+
+def test_over_budget_item_is_carried_into_next_batch(make_stub_model):
+    model = make_stub_model()
+    # 2 tokens each; a budget of 6 padded tokens fits three of them.
+    texts = ["ami jai", "tumi jao", "se jay", "amra jai"]
+    results = run_batch(model, [(t, "greedy") for t in texts], max_batch_tokens=6)
+
+    assert model.calls == [("greedy", texts[:3]), ("greedy", texts[3:])]
+    assert results == [f"greedy:{t}" for t in texts]
+
+
+def test_max_batch_size_splits_batches(make_stub_model):
+    model = make_stub_model()
+    texts = ["a", "b", "c"]
+    run_batch(model, [(t, "greedy") for t in texts], max_batch_size=2)
+
+    assert [len(batch) for _, batch in model.calls] == [2, 1]
+
+
+def test_mixed_modes_are_split_into_separate_calls(make_stub_model):
+    model = make_stub_model()
+    requests = [("ami", "greedy"), ("tumi", "beam"), ("se", "greedy")]
+    results = run_batch(model, requests)
+
+    assert sorted(model.calls) == [("beam", ["tumi"]), ("greedy", ["ami", "se"])]
+    assert results == ["greedy:ami", "beam:tumi", "greedy:se"]
+
+
+def test_stop_fails_unanswered_requests(make_stub_model):
+    release = threading.Event()
+
+    def blocked(text, mode):
+        release.wait(5)
+        return text
+
+    async def main():
+        batcher = MicroBatcher(make_stub_model(blocked), window_ms=1, max_batch_size=1, max_batch_tokens=1000)
+        batcher.start()
+        # First request is stuck in generate(), the others wait in the queue.
+        tasks = [asyncio.create_task(batcher.submit(text)) for text in ("ami", "tumi", "se")]
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
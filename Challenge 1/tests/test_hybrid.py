@@ -0,0 +1,93 @@
+"""
+test_hybrid.py
+Dictionary-first transliteration with the stub model from conftest.py (no torch needed).
+"""
+import pytest
+
+from app.utils.hybrid import HybridTransliterator, LRUCache, _split_token
+from app.utils.word_table import WordTable, write_word_table
+
+
+@pytest.fixture
+def model(make_stub_model):
+    return make_stub_model(lambda text, mode: f"<{text}>")
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = str(tmp_path / "table.bin")
+    write_word_table({"ami": "আমি", "bhalo": "ভালো", "achi": "আছি"}, path)
+    table = WordTable(path)
+    yield table
+    table.close()
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("kemon", ("", "kemon", "")),
+    ("kemon?", ("", "kemon", "?")),
+    ("(ami),", ("(", "ami", "),")),
+    ("...", ("...", "", "")),
+    ("ami।", ("", "ami", "।")),
+])
+def test_split_token(token, expected):
+    assert _split_token(token) == expected
+
+
+def test_output_is_reassembled_around_table_words(model, table):
+    hybrid = HybridTransliterator(model, table)
+
+    outputs = hybrid.generate(["Ami kemon achi?", "ami xx yy bhalo", "... ami"])
+
+    assert outputs == ["আমি <kemon> আছি?", "আমি <xx yy> ভালো", "... আমি"]
+
+
+def test_oov_spans_go_to_the_model_in_one_call(model, table):
+    hybrid = HybridTransliterator(model, table)
+
+    hybrid.generate(["ami kemon achi", "tumi bhalo", "ami kemon"])
+
+    # Duplicate span "kemon" is decoded once; all spans share one generate() call.
+    assert model.calls == [("greedy", ["kemon", "tumi"])]
+    assert hybrid.stats["model_spans"] == 2
+
+
+def test_repeat_input_is_served_from_lru(model, table):
+    hybrid = HybridTransliterator(model, table)
+
+    first = hybrid.generate(["ami kemon achi"])
+    second = hybrid.generate(["ami kemon achi"])
+
+    assert first == second
+    assert model.calls == [("greedy", ["kemon"])]
+    assert hybrid.stats["cached_spans"] == 1
+
+
+def test_cache_is_keyed_by_decoding_mode(model, table):
+    hybrid = HybridTransliterator(model, table)
+
+    hybrid.generate(["kemon"], "greedy")
+    hybrid.generate(["kemon"], "beam")
+
+    assert model.calls == [("greedy", ["kemon"]), ("beam", ["kemon"])]
+
+
+def test_oov_spans_are_chunked_by_batch_limits(model, table):
+    hybrid = HybridTransliterator(model, table, max_batch_size=2, max_batch_tokens=4)
+
+    hybrid.generate(["a", "b", "c", "d e f", "g h"])
+
+    # Size limit splits a/b from c; "d e f" (3 tokens) would make c's batch 6 padded tokens.
+    assert [texts for _, texts in model.calls] == [["a", "b"], ["c"], ["d e f"], ["g h"]]
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert len(cache) == 2
@@ -0,0 +1,49 @@
+"""
+test_quantize.py
+int8 export/load round trip on a tiny random mT5 checkpoint (skipped without torch).
+"""
+import os
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("sentencepiece")
+
+from transformers import AutoModelForSeq2SeqLM
+
+from app.utils.quantize import QUANTIZED_WEIGHTS, export_quantized, is_quantized_checkpoint, load_quantized, quantize_model
+from make_tiny_checkpoint import build_tiny_checkpoint
+
+
+@pytest.fixture(scope="module")
+def checkpoints(tmp_path_factory):
+    fp32 = str(tmp_path_factory.mktemp("tiny-mt5"))
+    build_tiny_checkpoint(fp32)
+    int8 = export_quantized(fp32, str(tmp_path_factory.mktemp("tiny-mt5-int8")))
+    return fp32, int8
+
+
+def test_export_writes_a_plain_state_dict(checkpoints):
+    fp32, int8 = checkpoints
+
+    assert is_quantized_checkpoint(int8) and not is_quantized_checkpoint(fp32)
+    # weights_only=True refuses pickled modules, so this only passes for tensors.
+    state_dict = torch.load(os.path.join(int8, QUANTIZED_WEIGHTS), weights_only=True)
+    assert "shared.weight" in state_dict
+    assert all(isinstance(v, torch.Tensor) and not v.is_quantized for v in state_dict.values())
+    assert state_dict["lm_head.weight_int8"].dtype == torch.int8
+
+
+def test_loaded_model_matches_in_memory_quantization(checkpoints):
+    fp32, int8 = checkpoints
+    expected = quantize_model(AutoModelForSeq2SeqLM.from_pretrained(fp32).eval())
+    loaded = load_quantized(int8)
+
+    tensors = list(loaded.parameters()) + list(loaded.buffers())
+    assert not any(t.is_meta for t in tensors)
+    assert type(loaded.lm_head) is type(expected.lm_head)
+
+    input_ids = torch.tensor([[5, 6, 7, 1], [8, 9, 1, 0]])
+    kwargs = dict(input_ids=input_ids, attention_mask=(input_ids != 0).long(), max_new_tokens=8, num_beams=2)
+    assert torch.equal(loaded.generate(**kwargs), expected.generate(**kwargs))
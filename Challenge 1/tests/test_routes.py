@@ -0,0 +1,56 @@
+"""
+test_routes.py
+Validation in the /transliterate route, with a stub batcher in place of the model.
+"""
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.routes import transliterate
+
+
+class StubBatcher:
+    def __init__(self, model):
+        self.model = model
+        self.submitted = []
+
+    async def submit(self, text, mode="greedy", num_tokens=None):
+        self.submitted.append((text, mode, num_tokens))
+        return f"{mode}:{text}"
+
+
+@pytest.fixture
+def client(make_stub_model):
+    app = FastAPI()
+    app.include_router(transliterate.router)
+    app.state.settings = Settings(max_length=5)
+    app.state.batcher = StubBatcher(make_stub_model())
+    return TestClient(app)
+
+
+def test_transliterates_stripped_text(client):
+    response = client.post("/transliterate", json={"text": "  ami bhalo achi ", "mode": "beam"})
+
+    assert response.status_code == 200
+    assert response.json() == {"text": "  ami bhalo achi ", "transliteration": "beam:ami bhalo achi", "mode": "beam"}
+    assert client.app.state.batcher.submitted == [("ami bhalo achi", "beam", 3)]
+
+
+@pytest.mark.parametrize("payload", [{"text": "   "}, {"text": "ami", "mode": "sampling"}])
+def test_bad_requests_are_rejected(client, payload):
+    response = client.post("/transliterate", json=payload)
+
+    assert response.status_code == 400
+    assert client.app.state.batcher.submitted == []
+
+
+def test_over_length_text_is_rejected_not_truncated(client):
+    response = client.post("/transliterate", json={"text": "ami tomake onek onek beshi bhalobashi"})
+
+    assert response.status_code == 413
+    assert client.app.state.batcher.submitted == []
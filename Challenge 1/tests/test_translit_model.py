@@ -0,0 +1,47 @@
+"""
+test_translit_model.py
+TransliterationModel against a tiny random mT5 checkpoint (see make_tiny_checkpoint.py).
+Outputs are meaningless; only shapes, limits and modes are checked.
+"""
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("sentencepiece")
+
+from app.config import Settings
+from app.utils.translit_model import TransliterationModel
+from make_tiny_checkpoint import build_tiny_checkpoint
+
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tiny-mt5"))
+    build_tiny_checkpoint(path)
+    return TransliterationModel(Settings(model_path=path, num_threads=1, max_length=16, num_beams=2))
+
+
+def test_tokenizer_has_the_trained_vocabulary(model):
+    # Only pad/eos/unk would mean the SentencePiece model was not picked up.
+    assert len(model.tokenizer) > 50
+    assert model.tokenizer.unk_token_id not in model.tokenizer("ami bhalo achi")["input_ids"]
+
+
+@pytest.mark.parametrize("mode", ["greedy", "beam"])
+def test_generate_returns_one_string_per_input(model, mode):
+    outputs = model.generate(["ami bhalo achi", "tumi kemon acho"], mode)
+
+    assert len(outputs) == 2
+    assert all(isinstance(out, str) for out in outputs)
+
+
+def test_unknown_mode_raises(model):
+    with pytest.raises(ValueError):
+        model.generate(["ami"], "sampling")
+
+
+def test_count_tokens_is_not_truncated(model):
+    long_text = " ".join(["ami tomake bhalobashi"] * 10)
+
+    assert model.count_tokens("ami") < model.count_tokens("ami bhalo achi")
+    assert model.count_tokens(long_text) > model.settings.max_length
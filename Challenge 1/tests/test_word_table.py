@@ -0,0 +1,61 @@
+"""
+test_word_table.py
+Round trip of the memory-mapped word table and how mappings are learned.
+"""
+from collections import Counter
+
+from app.utils.word_table import WordTable, _slot_for, build_word_mapping, write_word_table
+
+
+def test_round_trip_with_collisions_and_misses(tmp_path):
+    mapping = {f"word{i}": f"শব্দ{i}" for i in range(50)}
+    path = str(tmp_path / "table.bin")
+    # A nearly full table guarantees linear probing is exercised.
+    write_word_table(mapping, path, load_factor=0.95)
+
+    table = WordTable(path)
+    try:
+        slots = Counter(_slot_for(key.encode("utf-8"), table.n_slots) for key in mapping)
+        assert max(slots.values()) > 1
+
+        assert len(table) == 50
+        for key, value in mapping.items():
+            assert table.get(key) == value
+        assert table.get("missing") is None
+        assert table.get("word50") is None
+        assert "word7" in table
+        assert "" not in table
+    finally:
+        table.close()
+
+
+def test_empty_table(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    write_word_table({}, path)
+
+    table = WordTable(path)
+    try:
+        assert len(table) == 0
+        assert table.get("ami") is None
+    finally:
+        table.close()
+
+
+def test_build_word_mapping_keeps_only_dominant_spellings():
+    pairs = [
+        ("Ami bhalo achi.", "আমি ভালো আছি।"),
+        ("ami jai", "আমি যাই"),
+        ("kal jabo", "কাল যাবো"),
+        ("kal jabo", "কালো যাবো"),
+        ("ek dui tin", "এক দুই"),  # word counts differ: skipped
+    ]
+    mapping = build_word_mapping(pairs, min_count=2, min_share=0.6)
+
+    # Lowercased and stripped of punctuation on both sides.
+    assert mapping["ami"] == "আমি"
+    # "kal" is split 50/50 between two spellings.
+    assert "kal" not in mapping
+    assert mapping["jabo"] == "যাবো"
+    # Seen only once.
+    assert "bhalo" not in mapping
+    assert "ek" not in mapping
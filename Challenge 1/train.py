@@ -0,0 +1,42 @@
+"""
+train.py
+Command-line entry point for fine-tuning mT5 on Banglish -> Bengali (see app/utils/training.py).
+
+Usage:
+    python train.py
+    python train.py --data-file local_pairs.csv --epochs 1 --no-push
+"""
+import argparse
+
+from app.utils.training import CACHE_DIR, build_trainer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fine-tune mT5 for Banglish -> Bengali transliteration.")
+    parser.add_argument("--model", default="google/mt5-small")
+    parser.add_argument("--data-file", default=None, help="Local parallel file with rm/bn columns (default: Hub dataset)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Where the tokenized Arrow cache lives")
+    parser.add_argument("--output-dir", default="banglish2bangla-mbart")
+    parser.add_argument("--epochs", type=float, default=3)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--hub-model-id", default="torr20/another-avro")
+    parser.add_argument("--no-push", action="store_true", help="Skip pushing the model to the Hub")
+    args = parser.parse_args()
+
+    trainer = build_trainer(
+        model_name=args.model,
+        output_dir=args.output_dir,
+        data_file=args.data_file,
+        cache_dir=args.cache_dir,
+        num_train_epochs=args.epochs,
+        per_device_train_batch_size=args.batch_size,
+        per_device_eval_batch_size=args.batch_size,
+        hub_model_id=args.hub_model_id
+    )
+    trainer.train()
+    if not args.no_push:
+        trainer.push_to_hub()
+
+
+if __name__ == "__main__":
+    main()
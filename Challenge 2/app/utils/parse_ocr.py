@@ -1,17 +1,241 @@
 """
 parse_ocr.py
 Utility for extracting text from images via Tesseract OCR.
+
+Images are run through a small preprocessing pipeline before Tesseract sees them:
+EXIF orientation -> grayscale (dark backgrounds inverted) -> DPI/size normalization
+-> adaptive binarization -> deskew -> crop to text.
+Every step can be toggled through OCRConfig.
 """
+import shlex
+from dataclasses import dataclass
+from typing import Optional
+
 import pytesseract
-from PIL import Image
+from PIL import Image, ImageChops, ImageFilter, ImageOps, ImageStat
+
+# Characters that actually show up in recipes (titles, amounts, units, field labels).
+# Restricting Tesseract to these stops it from "finding" box-drawing junk in photos.
+RECIPE_CHAR_WHITELIST = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "abcdefghijklmnopqrstuvwxyz"
+    "0123456789"
+    ".,:;-/()%&+!?*#'\"°½¼¾⅓⅔"
+)
+
+
+@dataclass
+class OCRConfig:
+    """
+    Settings for the preprocessing pipeline and the Tesseract call.
+    """
+    grayscale: bool = True
+    # Dark-mode screenshots (light text on dark) are inverted so text is always dark on light.
+    invert_dark: bool = True
+    normalize_dpi: bool = True
+    binarize: bool = True
+    deskew: bool = True
+    crop_text: bool = True
+
+    # DPI normalization: Tesseract is tuned for ~300 DPI text.
+    target_dpi: int = 300
+    # Only DPI tags above this are trusted as scan resolutions. Screenshots are typically
+    # tagged 72-144 DPI, and lower tags are usually bogus, so those are ignored.
+    max_screen_dpi: int = 200
+    # Used when the image carries no usable DPI info (screenshots, most phone photos).
+    min_side: int = 1000
+    max_side: int = 2000
+    # Upscaling multiplies the pixels Tesseract has to scan; never enlarge more than this.
+    max_upscale: float = 1.5
+
+    # Adaptive binarization: a pixel is "ink" if it is this much darker than its local mean.
+    binarize_window: int = 15
+    binarize_offset: int = 10
+
+    # Deskew search range/step in degrees.
+    max_skew_angle: float = 5.0
+    skew_step: float = 0.5
+
+    crop_padding: int = 20
+
+    # Tesseract options. PSM 6 = "assume a single uniform block of text".
+    psm: int = 6
+    lang: str = "eng"
+    char_whitelist: Optional[str] = RECIPE_CHAR_WHITELIST
+
+
+DEFAULT_OCR_CONFIG = OCRConfig()
+
+
+def to_grayscale(img: Image.Image) -> Image.Image:
+    """
+    Convert to 8-bit grayscale. Transparent pixels are flattened onto white first,
+    otherwise RGBA screenshots come out as white text on a black background.
+    """
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+        img = Image.alpha_composite(background, img)
+    return img.convert("L")
+
+
+def invert_if_dark(img: Image.Image) -> Image.Image:
+    """
+    Invert a grayscale image whose background is dark (median below mid-gray),
+    so the rest of the pipeline always sees dark text on a light background.
+    """
+    if ImageStat.Stat(img).median[0] < 128:
+        return ImageOps.invert(img)
+    return img
+
+
+def normalize_dpi(img: Image.Image, config: OCRConfig, dpi: Optional[tuple] = None) -> Image.Image:
+    """
+    Resize the image so text is roughly at config.target_dpi.
+    Only scan-like DPI tags (above max_screen_dpi) are trusted. Otherwise the
+    longest side is clamped into [min_side, max_side]: large phone photos get shrunk
+    (big speed win), small screenshots get enlarged a little. Upscaling is capped at max_upscale.
+    """
+    dpi = dpi or img.info.get("dpi")
+    width, height = img.size
+    longest = max(width, height)
+
+    scale = 1.0
+    if dpi and dpi[0] and dpi[0] > config.max_screen_dpi:
+        scale = config.target_dpi / float(dpi[0])
+    if longest * scale > config.max_side:
+        scale = config.max_side / float(longest)
+    elif longest * scale < config.min_side:
+        scale = config.min_side / float(longest)
+    scale = min(scale, config.max_upscale)
+
+    if abs(scale - 1.0) < 0.05:
+        return img
+    new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    return img.resize(new_size, Image.LANCZOS)
+
+
+def adaptive_binarize(img: Image.Image, config: OCRConfig) -> Image.Image:
+    """
+    Local-mean thresholding on a grayscale image. Handles uneven lighting
+    (shadows across a phone photo) far better than one global threshold.
+    Returns black text on a white background.
+    """
+    local_mean = img.filter(ImageFilter.BoxBlur(config.binarize_window))
+    # How much darker each pixel is than its neighbourhood (clipped at 0).
+    darkness = ImageChops.subtract(local_mean, img)
+    offset = config.binarize_offset
+    return darkness.point(lambda v: 0 if v > offset else 255)
+
+
+def _row_profile_score(img: Image.Image) -> float:
+    """
+    Score how well text lines line up horizontally: the sharper the jumps between
+    row ink densities, the straighter the text.
+    """
+    rows = list(img.resize((1, img.height), Image.BOX).tobytes())
+    return float(sum((rows[i + 1] - rows[i]) ** 2 for i in range(len(rows) - 1)))
+
+
+def estimate_skew_angle(img: Image.Image, config: OCRConfig) -> float:
+    """
+    Find the small rotation (in degrees) that best straightens the text lines,
+    using a projection-profile search on a downscaled copy of a binarized image.
+    """
+    # Work on a small inverted copy (ink = white) so the search is cheap.
+    probe = ImageOps.invert(img)
+    probe.thumbnail((600, 600))
+
+    best_angle = 0.0
+    best_score = _row_profile_score(probe)
+    steps = int(config.max_skew_angle / config.skew_step)
+    for i in range(-steps, steps + 1):
+        angle = i * config.skew_step
+        if angle == 0:
+            continue
+        score = _row_profile_score(probe.rotate(angle, resample=Image.BILINEAR, fillcolor=0))
+        if score > best_score:
+            best_angle, best_score = angle, score
+    return best_angle
+
+
+def deskew(img: Image.Image, config: OCRConfig) -> Image.Image:
+    """
+    Rotate the image so text lines are horizontal.
+    """
+    angle = estimate_skew_angle(img, config)
+    if angle == 0:
+        return img
+    return img.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=255)
+
+
+def crop_to_text(img: Image.Image, config: OCRConfig) -> Image.Image:
+    """
+    Crop away empty margins around the text so Tesseract has fewer pixels to scan.
+    Expects dark text on a light background.
+    """
+    bbox = ImageOps.invert(img).point(lambda v: 255 if v > 128 else 0).getbbox()
+    if not bbox:
+        return img
+    pad = config.crop_padding
+    left, top, right, bottom = bbox
+    return img.crop((
+        max(0, left - pad),
+        max(0, top - pad),
+        min(img.width, right + pad),
+        min(img.height, bottom + pad),
+    ))
+
+
+def preprocess_image(img: Image.Image, config: OCRConfig = DEFAULT_OCR_CONFIG) -> Image.Image:
+    """
+    Run the enabled preprocessing steps on a PIL image and return the result.
+    """
+    # Grab DPI up front: flattening the alpha channel drops the image metadata.
+    dpi = img.info.get("dpi")
+    # Phone photos are often stored sideways with an EXIF orientation tag; deskew only fixes small angles.
+    img = ImageOps.exif_transpose(img)
+    if config.grayscale or config.binarize:
+        img = to_grayscale(img)
+        if config.invert_dark:
+            img = invert_if_dark(img)
+    if config.normalize_dpi:
+        img = normalize_dpi(img, config, dpi)
+    if config.binarize:
+        img = adaptive_binarize(img, config)
+    # Deskew and cropping rely on a clean black-on-white image.
+    if config.binarize and config.deskew:
+        img = deskew(img, config)
+    if config.binarize and config.crop_text:
+        img = crop_to_text(img, config)
+    return img
+
+
+def build_tesseract_config(config: OCRConfig = DEFAULT_OCR_CONFIG) -> str:
+    """
+    Build the command-line options passed to Tesseract.
+    """
+    options = f"--psm {config.psm}"
+    if config.char_whitelist:
+        # pytesseract shlex-splits the config string, so quote the value (it contains ' and ").
+        options += " -c " + shlex.quote(f"tessedit_char_whitelist={config.char_whitelist}")
+    return options
+
 
-def extract_text_from_image(image_path: str) -> str:
+def extract_text_from_image(image_path: str, config: OCRConfig = DEFAULT_OCR_CONFIG) -> str:
     """
     Extract text from the image at image_path using pytesseract.
+    The image is preprocessed according to config before OCR.
     Returns the raw text as a string.
     """
     # Open the image using PIL
-    img = Image.open(image_path)
+    with Image.open(image_path) as img:
+        img.load()
+        prepared = preprocess_image(img, config)
     # Perform OCR using pytesseract
-    extracted_text = pytesseract.image_to_string(img)
+    extracted_text = pytesseract.image_to_string(
+        prepared,
+        lang=config.lang,
+        config=build_tesseract_config(config)
+    )
     return extracted_text
@@ -0,0 +1,139 @@
+"""
+benchmark_ocr.py
+Compares raw Tesseract OCR against the preprocessed pipeline in app/utils/parse_ocr.py.
+
+For every image it reports OCR latency and how close the extracted text is to a reference
+transcript in ocr_references/<first 12 hex chars of the image's sha256>.txt. An image counts
+as read correctly when every required field label starts a line of the OCR output and the
+text similarity to the reference is at least --min-similarity.
+Images are de-duplicated by content, so the same screenshot is never counted twice.
+
+Usage (from the Challenge 2 folder):
+    python benchmark_ocr.py
+    python benchmark_ocr.py path/to/image.png other/image.jpg --repeat 3
+"""
+import argparse
+import difflib
+import glob
+import hashlib
+import os
+import statistics
+import re
+import time
+
+import pytesseract
+from PIL import Image
+
+from app.utils.parse_ocr import extract_text_from_image
+
+DEFAULT_IMAGES = sorted(glob.glob(os.path.join("uploads", "*"))) + [os.path.join("..", "test.png")]
+REFERENCE_DIR = "ocr_references"
+REQUIRED_LABELS = ("Title", "Ingredients", "Instructions")
+
+
+def raw_ocr(image_path: str) -> str:
+    """
+    The original behaviour: the uploaded image straight into Tesseract, default settings.
+    """
+    with Image.open(image_path) as img:
+        return pytesseract.image_to_string(img)
+
+
+def content_key(image_path: str) -> str:
+    with open(image_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def unique_images(image_paths: list) -> dict:
+    """
+    Map content key -> first path with that content, dropping byte-identical copies.
+    """
+    images = {}
+    for path in image_paths:
+        images.setdefault(content_key(path), path)
+    return images
+
+
+def load_reference(key: str) -> str:
+    path = os.path.join(REFERENCE_DIR, f"{key}.txt")
+    if not os.path.isfile(path):
+        return ""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def normalize_text(text: str) -> str:
+    # Blank lines and runs of spaces vary between OCR runs and say nothing about accuracy.
+    return "\n".join(" ".join(line.split()) for line in text.splitlines() if line.strip())
+
+
+def similarity(text: str, reference: str) -> float:
+    return difflib.SequenceMatcher(None, normalize_text(text), normalize_text(reference)).ratio()
+
+
+def has_labels(text: str) -> bool:
+    """
+    True if every required label starts a line (the content may follow on later lines).
+    """
+    return all(
+        re.search(rf"^\s*{label}\s*:", text, re.IGNORECASE | re.MULTILINE) for label in REQUIRED_LABELS
+    )
+
+
+def run(ocr_fn, images: dict, repeat: int, min_similarity: float) -> dict:
+    """
+    Run ocr_fn over every image `repeat` times, timing each call and scoring the last output.
+    """
+    latencies = []
+    scores = []
+    successes = 0
+    for key, path in images.items():
+        text = ""
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = ocr_fn(path)
+            latencies.append(time.perf_counter() - start)
+        score = similarity(text, load_reference(key))
+        scores.append(score)
+        if has_labels(text) and score >= min_similarity:
+            successes += 1
+    return {
+        "mean_s": statistics.mean(latencies),
+        "median_s": statistics.median(latencies),
+        "max_s": max(latencies),
+        "similarity": statistics.mean(scores),
+        "success_rate": successes / len(images),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR latency and recipe parse success.")
+    parser.add_argument("images", nargs="*", help="Images to benchmark (default: uploads/* and ../test.png)")
+    parser.add_argument("--repeat", type=int, default=1, help="OCR runs per image for timing")
+    parser.add_argument("--min-similarity", type=float, default=0.9, help="Similarity to the reference needed to pass")
+    args = parser.parse_args()
+
+    images = unique_images([p for p in (args.images or DEFAULT_IMAGES) if os.path.isfile(p)])
+    if not images:
+        print("No images found to benchmark.")
+        return
+    missing = [path for key, path in images.items() if not load_reference(key)]
+    if missing:
+        print(f"No reference transcript (similarity counts as 0) for: {', '.join(missing)}")
+
+    print(f"Benchmarking {len(images)} unique image(s), {args.repeat} run(s) each\n")
+    results = {
+        "before (raw)": run(raw_ocr, images, args.repeat, args.min_similarity),
+        "after (preprocessed)": run(extract_text_from_image, images, args.repeat, args.min_similarity),
+    }
+
+    print(f"{'pipeline':<22}{'mean s':>10}{'median s':>10}{'max s':>10}{'similarity':>12}{'correct':>10}")
+    for name, r in results.items():
+        print(
+            f"{name:<22}{r['mean_s']:>10.3f}{r['median_s']:>10.3f}{r['max_s']:>10.3f}"
+            f"{r['similarity']:>12.3f}{r['success_rate']:>10.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
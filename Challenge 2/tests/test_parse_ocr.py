@@ -0,0 +1,82 @@
+"""
+test_parse_ocr.py
+The Pillow preprocessing steps and the Tesseract config string (Tesseract itself is not needed).
+"""
+import os
+import shlex
+
+import pytest
+from PIL import Image, ImageDraw
+
+from app.utils.parse_ocr import (
+    DEFAULT_OCR_CONFIG,
+    RECIPE_CHAR_WHITELIST,
+    build_tesseract_config,
+    crop_to_text,
+    estimate_skew_angle,
+    normalize_dpi,
+    preprocess_image,
+)
+
+DARK_MODE_IMAGE = os.path.join(
+    os.path.dirname(__file__), "..", "uploads", "a09aa07f-fbfb-44ff-baac-bc8c1911990f.png"
+)
+
+
+def text_lines(size=(800, 600)) -> Image.Image:
+    """
+    White page with thick black bars standing in for lines of text.
+    """
+    img = Image.new("L", size, 255)
+    draw = ImageDraw.Draw(img)
+    for top in range(100, size[1] - 100, 40):
+        draw.rectangle((100, top, size[0] - 100, top + 12), fill=0)
+    return img
+
+
+def test_whitelist_survives_shell_splitting():
+    args = shlex.split(build_tesseract_config())
+    assert args[:3] == ["--psm", str(DEFAULT_OCR_CONFIG.psm), "-c"]
+    assert args[3] == f"tessedit_char_whitelist={RECIPE_CHAR_WHITELIST}"
+    assert "'" in RECIPE_CHAR_WHITELIST and '"' in RECIPE_CHAR_WHITELIST
+
+
+@pytest.mark.parametrize("size, dpi, expected", [
+    ((800, 400), (120, 120), (1000, 500)),     # screen DPI tag ignored, small side brought up to min_side
+    ((800, 400), (10, 10), (1000, 500)),       # bogus DPI tag ignored
+    ((3000, 2000), (600, 600), (1500, 1000)),  # real scan downsampled to target_dpi
+    ((4000, 3000), None, (2000, 1500)),        # huge screenshot capped at max_side
+    ((200, 100), None, (300, 150)),            # tiny image: upscaling capped at max_upscale
+    ((1200, 1000), None, (1200, 1000)),        # already in range
+])
+def test_normalize_dpi(size, dpi, expected):
+    img = Image.new("L", size, 255)
+    assert normalize_dpi(img, DEFAULT_OCR_CONFIG, dpi).size == expected
+
+
+def test_crop_to_text_keeps_padding():
+    img = Image.new("L", (500, 400), 255)
+    ImageDraw.Draw(img).rectangle((100, 150, 199, 249), fill=0)
+    pad = DEFAULT_OCR_CONFIG.crop_padding
+
+    cropped = crop_to_text(img, DEFAULT_OCR_CONFIG)
+    assert cropped.size == (100 + 2 * pad, 100 + 2 * pad)
+    # A blank page is left alone.
+    blank = Image.new("L", (500, 400), 255)
+    assert crop_to_text(blank, DEFAULT_OCR_CONFIG).size == (500, 400)
+
+
+@pytest.mark.parametrize("rotation", [3.0, -2.0, 0.0])
+def test_estimate_skew_angle_undoes_rotation(rotation):
+    img = text_lines().rotate(rotation, resample=Image.BICUBIC, expand=True, fillcolor=255)
+    angle = estimate_skew_angle(img, DEFAULT_OCR_CONFIG)
+    assert abs(angle + rotation) <= DEFAULT_OCR_CONFIG.skew_step
+
+
+def test_dark_mode_screenshot_becomes_black_on_white():
+    with Image.open(DARK_MODE_IMAGE) as img:
+        out = preprocess_image(img)
+    histogram = out.convert("L").histogram()
+    black_share = sum(histogram[:128]) / (out.width * out.height)
+    # Text is a small part of the page; an un-inverted dark screenshot would be mostly black.
+    assert 0 < black_share < 0.2